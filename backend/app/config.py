@@ -25,6 +25,8 @@ class Settings(BaseSettings):
     safety_classifier_mode: str = Field(default="heuristic", description="heuristic|trained")
     safety_model_path: str = "models/safety_classifier.joblib"
     safety_harm_threshold: float = 0.62
+    safety_batch_max_size: int = 32
+    safety_batch_max_wait_ms: float = 2.0
 
 
 settings = Settings()
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-
-import httpx
+from typing import TYPE_CHECKING
 
 from .config import settings
 
+if TYPE_CHECKING:
+    import httpx
+
+_MOCK_PREFIX = "Draft response based on sanitized input: "
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    # One pooled client per process so keep-alive connections are reused across requests.
+    global _client
+    if _client is None:
+        # Imported lazily so the mock provider never pays for httpx.
+        import httpx
+
+        _client = httpx.AsyncClient(
+            timeout=settings.llm_timeout_seconds,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class LLMProvider(ABC):
     @abstractmethod
@@ -15,7 +42,7 @@ class LLMProvider(ABC):
 
 class MockProvider(LLMProvider):
     async def generate(self, prompt: str, temperature: float, seed: int | None) -> str:
-        return f"Draft response based on sanitized input: {prompt[:500]}"
+        return _MOCK_PREFIX + prompt[:500]
 
 
 class OpenAICompatibleProvider(LLMProvider):
@@ -42,10 +69,9 @@ class OpenAICompatibleProvider(LLMProvider):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=settings.llm_timeout_seconds) as client:
-            resp = await client.post(f"{settings.llm_api_base}/chat/completions", json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().post(f"{settings.llm_api_base}/chat/completions", json=payload, headers=headers)
+        resp.raise_for_status()
+        data = resp.json()
 
         return data["choices"][0]["message"]["content"]
 
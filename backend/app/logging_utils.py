@@ -3,15 +3,14 @@ import re
 
 
 class RedactingFilter(logging.Filter):
-    SECRET_PATTERNS = [
-        re.compile(r"sk-[A-Za-z0-9]{10,}"),
-        re.compile(r"Bearer\s+[A-Za-z0-9\-\._~\+/]+=*", re.IGNORECASE),
-    ]
+    # API keys are matched case-sensitively, bearer tokens case-insensitively.
+    SECRET_PATTERN = re.compile(r"sk-[A-Za-z0-9]{10,}|(?i:Bearer)\s+[A-Za-z0-9\-\._~\+/]+=*")
 
     def filter(self, record: logging.LogRecord) -> bool:
         message = str(record.getMessage())
-        for pattern in self.SECRET_PATTERNS:
-            message = pattern.sub("[REDACTED]", message)
+        # Cheap substring prefilter: most log lines carry no secrets.
+        if "sk-" in message or "bearer" in message.lower():
+            message = self.SECRET_PATTERN.sub("[REDACTED]", message)
         record.msg = message
         record.args = ()
         return True
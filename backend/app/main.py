@@ -1,24 +1,48 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import settings
-from .llm_provider import get_provider
+from .llm_provider import LLMProvider, close_http_client, get_provider
 from .logging_utils import configure_logging
-from .rules_engine import ConstitutionEngine, RuleContext, confidence_from_violations
-from .safety_classifier import get_safety_classifier
+from .rules_engine import RuleContext, confidence_from_violations, get_constitution_engine
+from .safety_classifier import (
+    SafetyClassifier,
+    close_prediction_batcher,
+    get_safety_classifier,
+    predict_safety,
+)
 from .sanitizer import sanitize_text
 from .schemas import ChatRequest, ChatResponse, LatestEvalReportResponse
 
 configure_logging(settings.log_level)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.app_name, version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Load the classifier (and its batcher) once at startup, not on the first requests.
+    get_safety_classifier()
+    yield
+    await close_prediction_batcher()
+    await close_http_client()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 allowed_origins = [origin.strip() for origin in settings.cors_allow_origins.split(",") if origin.strip()]
 app.add_middleware(
@@ -35,36 +59,76 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+# Async so FastAPI resolves them on the event loop instead of a threadpool hop per request.
+async def provider_dependency() -> LLMProvider:
+    return get_provider()
+
+
+async def safety_classifier_dependency() -> SafetyClassifier:
+    return get_safety_classifier()
+
+
+_report_cache: tuple[Path, int, LatestEvalReportResponse] | None = None
+
+
 @app.get("/eval/reports/latest", response_model=LatestEvalReportResponse)
 def latest_eval_report() -> LatestEvalReportResponse:
+    global _report_cache
     reports_dir = Path(settings.eval_reports_dir)
     if not reports_dir.is_absolute():
         reports_dir = Path(__file__).resolve().parents[1] / reports_dir
 
-    report_files = sorted(reports_dir.glob("eval_report_*.json"))
-    if not report_files:
+    latest: os.DirEntry[str] | None = None
+    try:
+        with os.scandir(reports_dir) as entries:
+            latest = max(
+                (e for e in entries if e.name.startswith("eval_report_") and e.name.endswith(".json")),
+                key=lambda e: e.name,
+                default=None,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    if latest is None:
         raise HTTPException(status_code=404, detail="No eval reports found")
 
-    latest_file = report_files[-1]
-    payload = json.loads(latest_file.read_text())
-    payload["source_file"] = latest_file.name
-    return LatestEvalReportResponse(**payload)
-
+    # Reports only change when a new eval runs; reuse the parsed model until the file changes.
+    latest_file = Path(latest.path)
+    mtime_ns = latest.stat().st_mtime_ns
+    if _report_cache is not None and _report_cache[:2] == (latest_file, mtime_ns):
+        return _report_cache[2]
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest) -> ChatResponse:
-    user_content = "\n".join([m.content for m in req.messages if m.role == "user"])
-    if len(user_content) > settings.max_message_chars:
-        raise HTTPException(status_code=400, detail="Input exceeds max_message_chars")
+    payload = orjson.loads(latest_file.read_bytes())
+    payload["source_file"] = latest_file.name
+    report = LatestEvalReportResponse(**payload)
+    _report_cache = (latest_file, mtime_ns, report)
+    return report
+
+
+@app.post("/chat", response_model=None, responses={200: {"model": ChatResponse}})
+async def chat(
+    req: ChatRequest,
+    provider: LLMProvider = Depends(provider_dependency),
+    safety_classifier: SafetyClassifier = Depends(safety_classifier_dependency),
+) -> ORJSONResponse:
+    max_chars = settings.max_message_chars
+    user_parts: list[str] = []
+    total_chars = -1  # the first part has no joining newline
+    for message in req.messages:
+        if message.role != "user":
+            continue
+        total_chars += len(message.content) + 1
+        if total_chars > max_chars:
+            raise HTTPException(status_code=400, detail="Input exceeds max_message_chars")
+        user_parts.append(message.content)
+    user_content = "\n".join(user_parts)
 
     sanitization = sanitize_text(user_content)
     if sanitization.flagged_patterns:
         logger.info("Prompt injection signals detected: %s", sanitization.flagged_patterns)
 
-    safety_classifier = get_safety_classifier()
-    pre_safety = safety_classifier.predict(sanitization.text)
+    lowered = sanitization.text.lower()
+    pre_safety = await predict_safety(safety_classifier, sanitization.text, lowered=lowered)
 
-    provider = get_provider()
     if pre_safety.label == "harmful" and pre_safety.score >= settings.safety_harm_threshold:
         draft = "Generation blocked by safety pre-check."
         post_safety = pre_safety
@@ -78,9 +142,9 @@ async def chat(req: ChatRequest) -> ChatResponse:
         except Exception as exc:
             logger.exception("LLM provider error: %s", exc)
             raise HTTPException(status_code=500, detail="LLM provider request failed") from exc
-        post_safety = safety_classifier.predict(draft)
+        post_safety = await predict_safety(safety_classifier, draft)
 
-    engine = ConstitutionEngine()
+    engine = get_constitution_engine()
     violations, rule_log, final_answer = engine.evaluate(
         RuleContext(
             user_text=sanitization.text,
@@ -91,13 +155,16 @@ async def chat(req: ChatRequest) -> ChatResponse:
             post_safety_label=post_safety.label,
             post_safety_score=post_safety.score,
             safety_threshold=settings.safety_harm_threshold,
+            user_text_lower=lowered,
         )
     )
 
-    return ChatResponse(
-        draft=draft,
-        violations=violations,
-        final_answer=final_answer,
-        confidence=confidence_from_violations(violations),
-        rule_applied_log=rule_log,
+    return ORJSONResponse(
+        {
+            "draft": draft,
+            "violations": violations,
+            "final_answer": final_answer,
+            "confidence": confidence_from_violations(violations),
+            "rule_applied_log": rule_log,
+        }
     )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from functools import lru_cache
+from itertools import accumulate
+
+import ahocorasick
+
+# Texts shorter than this have their matches memoized per index.
+_CACHE_MAX_CHARS = 4096
+
+
+class PhraseIndex:
+    """
+    Aho-Corasick automaton over several named phrase lists.
+    One linear pass over the text reports the matched phrases of every list,
+    instead of one substring scan per phrase.
+    """
+
+    def __init__(self, sources: Mapping[str, Iterable[str]]) -> None:
+        self.sources: dict[str, tuple[str, ...]] = {key: tuple(terms) for key, terms in sources.items()}
+        self._automaton = ahocorasick.Automaton()
+        for terms in self.sources.values():
+            for term in terms:
+                self._automaton.add_word(term, term)
+        self._automaton.make_automaton()
+        self._match_cached = lru_cache(maxsize=4096)(self._match)
+
+    def find(self, lowered: str) -> dict[str, list[str]]:
+        """Return matched phrases per source list, in declaration order. Expects lower-cased text."""
+        if len(lowered) < _CACHE_MAX_CHARS:
+            return self._collect(self._match_cached(lowered))
+        return self._collect(self._match(lowered))
+
+    def find_many(self, lowered_texts: Sequence[str]) -> list[dict[str, list[str]]]:
+        """Like `find` for several texts, using one automaton pass over their joined buffer."""
+        # Phrases never contain the separator, so no match can straddle two texts.
+        buffer = "\x1f".join(lowered_texts)
+        ends = list(accumulate(len(text) + 1 for text in lowered_texts))
+        found: list[set[str]] = [set() for _ in lowered_texts]
+        for end, term in self._automaton.iter(buffer):
+            found[bisect_right(ends, end)].add(term)
+        return [self._collect(terms) for terms in found]
+
+    def _match(self, lowered: str) -> frozenset[str]:
+        return frozenset(term for _, term in self._automaton.iter(lowered))
+
+    def _collect(self, found: Collection[str]) -> dict[str, list[str]]:
+        if not found:
+            return {key: [] for key in self.sources}
+        return {key: [term for term in terms if term in found] for key, terms in self.sources.items()}
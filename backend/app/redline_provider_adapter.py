@@ -15,6 +15,8 @@ class ConstitutionalSafetyProvider:
     def __init__(self) -> None:
         self.base_url = os.getenv("CONSTITUTIONAL_AGENT_URL", "http://localhost:8000")
         self.timeout = float(os.getenv("CONSTITUTIONAL_AGENT_TIMEOUT", "30"))
+        # Reused across calls so connections to the agent stay warm.
+        self._client = httpx.AsyncClient(timeout=self.timeout)
 
     async def generate(self, prompt: str, temperature: float = 0.2, seed: int | None = 42) -> str:
         payload = {
@@ -23,10 +25,12 @@ class ConstitutionalSafetyProvider:
             "seed": seed,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(f"{self.base_url}/chat", json=payload)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client.post(f"{self.base_url}/chat", json=payload)
+        response.raise_for_status()
+        data = response.json()
 
         # Redline usually expects one answer string for scoring.
         return data["final_answer"]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -1,6 +1,24 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
 
-from .schemas import RuleLogEntry, RuleViolation
+from .phrase_index import PhraseIndex
+
+
+# Plain records rather than pydantic models: they are built on every request and
+# serialized directly by orjson. `schemas.ChatResponse` documents the same shape.
+@dataclass(slots=True)
+class RuleViolation:
+    rule: str
+    violated: bool
+    reason: str
+
+
+@dataclass(slots=True)
+class RuleLogEntry:
+    rule: str
+    status: Literal["applied", "violated", "not_triggered"]
+    detail: str
 
 
 @dataclass
@@ -13,6 +31,11 @@ class RuleContext:
     post_safety_label: str = "unknown"
     post_safety_score: float = 0.0
     safety_threshold: float = 0.62
+    user_text_lower: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.user_text_lower:
+            self.user_text_lower = self.user_text.lower()
 
 
 RISK_PATTERNS: dict[str, list[str]] = {
@@ -68,22 +91,25 @@ RISK_PATTERNS: dict[str, list[str]] = {
 OVERCONFIDENT_PATTERNS = ["definitely", "guaranteed", "always true", "100% certain"]
 REALTIME_REQUEST_PATTERNS = ["today", "latest", "current", "right now", "real-time"]
 
+_OVERCONFIDENT = "overconfident"
+_REALTIME_REQUEST = "realtime_request"
+_PHRASES = PhraseIndex(
+    {
+        **RISK_PATTERNS,
+        _OVERCONFIDENT: OVERCONFIDENT_PATTERNS,
+        _REALTIME_REQUEST: REALTIME_REQUEST_PATTERNS,
+    }
+)
 
-def classify_risks(text: str) -> tuple[dict[str, int], dict[str, list[str]]]:
-    normalized = text.lower()
-    scores: dict[str, int] = {}
-    evidence: dict[str, list[str]] = {}
 
-    for category, terms in RISK_PATTERNS.items():
-        matches = [term for term in terms if term in normalized]
-        evidence[category] = matches
-        if len(matches) >= 2:
-            scores[category] = 3
-        elif len(matches) == 1:
-            scores[category] = 2
-        else:
-            scores[category] = 0
+def classify_risks(text: str, lowered: str | None = None) -> tuple[dict[str, int], dict[str, list[str]]]:
+    return _score_risks(_PHRASES.find(text.lower() if lowered is None else lowered))
 
+
+def _score_risks(found: dict[str, list[str]]) -> tuple[dict[str, int], dict[str, list[str]]]:
+    evidence = {category: found[category] for category in RISK_PATTERNS}
+    # One matched phrase scores 2, two or more score 3.
+    scores = {category: 2 + (len(matches) >= 2) if matches else 0 for category, matches in evidence.items()}
     return scores, evidence
 
 
@@ -101,10 +127,26 @@ class ConstitutionEngine:
     RULE_NON_DISCLOSURE = "non_disclosure"
 
     def evaluate(self, ctx: RuleContext) -> tuple[list[RuleViolation], list[RuleLogEntry], str]:
+        return self._evaluate(ctx, _PHRASES.find(ctx.user_text_lower), _PHRASES.find(ctx.draft.lower()))
+
+    def evaluate_batch(
+        self, contexts: list[RuleContext]
+    ) -> list[tuple[list[RuleViolation], list[RuleLogEntry], str]]:
+        """Evaluate many contexts with one phrase scan over all user texts and one over all drafts."""
+        user_found = _PHRASES.find_many([ctx.user_text_lower for ctx in contexts])
+        draft_found = _PHRASES.find_many([ctx.draft.lower() for ctx in contexts])
+        return [self._evaluate(*args) for args in zip(contexts, user_found, draft_found)]
+
+    def _evaluate(
+        self,
+        ctx: RuleContext,
+        user_found: dict[str, list[str]],
+        draft_found: dict[str, list[str]],
+    ) -> tuple[list[RuleViolation], list[RuleLogEntry], str]:
         violations: list[RuleViolation] = []
         logs: list[RuleLogEntry] = []
 
-        risk_scores, risk_evidence = classify_risks(ctx.user_text)
+        risk_scores, risk_evidence = _score_risks(user_found)
         highest_risk = max(risk_scores.values()) if risk_scores else 0
         risky_categories = [k for k, v in risk_scores.items() if v >= 2]
 
@@ -150,7 +192,7 @@ class ConstitutionEngine:
                 )
             )
 
-        overconfident = any(p in ctx.draft.lower() for p in OVERCONFIDENT_PATTERNS)
+        overconfident = bool(draft_found[_OVERCONFIDENT])
         if overconfident:
             violations.append(
                 RuleViolation(
@@ -182,7 +224,7 @@ class ConstitutionEngine:
                 )
             )
 
-        capability_risk = any(p in ctx.user_text.lower() for p in REALTIME_REQUEST_PATTERNS)
+        capability_risk = bool(user_found[_REALTIME_REQUEST])
         if capability_risk:
             violations.append(
                 RuleViolation(
@@ -281,6 +323,13 @@ class ConstitutionEngine:
         return violations, logs, final
 
 
+@lru_cache(maxsize=1)
+def get_constitution_engine() -> ConstitutionEngine:
+    # The engine holds no per-request state and its phrase index is built at import,
+    # so one instance serves the API and the eval runner alike.
+    return ConstitutionEngine()
+
+
 def confidence_from_violations(violations: list[RuleViolation]) -> float:
-    violated_count = sum(1 for v in violations if v.violated)
+    violated_count = sum(v.violated for v in violations)
     return max(0.05, round(1.0 - 0.16 * violated_count, 2))
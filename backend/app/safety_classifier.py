@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
 from .config import settings
+from .phrase_index import PhraseIndex
 
 
 @dataclass
@@ -15,12 +19,16 @@ class SafetyPrediction:
 
 
 class SafetyClassifier(Protocol):
-    def predict(self, text: str) -> SafetyPrediction:
+    def predict(self, text: str, lowered: str | None = None) -> SafetyPrediction:
+        ...
+
+    def predict_batch(self, texts: list[str]) -> list[SafetyPrediction]:
         ...
 
 
 class HeuristicSafetyClassifier:
-    HARMFUL_TERMS = [
+    # Immutable: the automaton below is built from this tuple once, at import.
+    HARMFUL_TERMS = (
         "kill someone",
         "how to kill",
         "murder",
@@ -35,37 +43,134 @@ class HeuristicSafetyClassifier:
         "ransomware",
         "ddos",
         "phishing",
-    ]
+    )
+    _phrases = PhraseIndex({"harmful": HARMFUL_TERMS})
+
+    def predict(self, text: str, lowered: str | None = None) -> SafetyPrediction:
+        return self._from_hits(self._phrases.find(text.lower() if lowered is None else lowered)["harmful"])
 
-    def predict(self, text: str) -> SafetyPrediction:
-        lower = text.lower()
-        hits = [term for term in self.HARMFUL_TERMS if term in lower]
+    def predict_batch(self, texts: list[str]) -> list[SafetyPrediction]:
+        found = self._phrases.find_many([text.lower() for text in texts])
+        return [self._from_hits(matches["harmful"]) for matches in found]
+
+    @staticmethod
+    def _from_hits(hits: list[str]) -> SafetyPrediction:
         if hits:
             score = min(0.99, 0.55 + 0.12 * len(hits))
             return SafetyPrediction(label="harmful", score=round(score, 3), source="heuristic")
         return SafetyPrediction(label="safe", score=0.9, source="heuristic")
 
 
+class PredictionBatcher:
+    """
+    Coalesces concurrent predictions into a single batched call run in a worker thread.
+    The first queued text waits up to `max_wait_ms` for others to arrive, so a
+    burst of requests costs one vectorizer/estimator pass instead of one each.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[list[str]], list[SafetyPrediction]],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ) -> None:
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[SafetyPrediction]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    async def predict(self, text: str) -> SafetyPrediction:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+
+        future: asyncio.Future[SafetyPrediction] = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def aclose(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+        if self._queue is not None:
+            # Texts the worker never picked up would otherwise be awaited forever.
+            pending = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+            _fail(pending, RuntimeError("Prediction batcher closed"))
+        self._worker = None
+        self._queue = None
+
+    async def _run(self, queue: asyncio.Queue[tuple[str, asyncio.Future[SafetyPrediction]]]) -> None:
+        while True:
+            batch = [await queue.get()]
+            try:
+                if self.max_wait:
+                    await asyncio.sleep(self.max_wait)
+                while len(batch) < self.max_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                # Off the event loop: other requests keep queueing while the model runs.
+                predictions = await asyncio.to_thread(self.predict_batch, [text for text, _ in batch])
+                if len(predictions) != len(batch):
+                    raise RuntimeError(f"predict_batch returned {len(predictions)} predictions for {len(batch)} texts")
+            except Exception as exc:
+                _fail(batch, exc)
+                continue
+            except BaseException:
+                # Cancelled (aclose/shutdown) mid-batch: callers get an error instead of hanging.
+                _fail(batch, RuntimeError("Prediction batcher closed"))
+                raise
+
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(prediction)
+
+
+def _fail(items: list[tuple[str, asyncio.Future[SafetyPrediction]]], exc: BaseException) -> None:
+    for _, future in items:
+        if not future.done():
+            future.set_exception(exc)
+
+
 class SklearnSafetyClassifier:
     def __init__(self, model_path: str) -> None:
         import joblib
 
         self.model = joblib.load(model_path)
-
-    def predict(self, text: str) -> SafetyPrediction:
-        labels = self.model.predict([text])
-        label = str(labels[0])
-
-        score = 0.5
-        if hasattr(self.model, "predict_proba"):
-            probs = self.model.predict_proba([text])[0]
-            classes = list(getattr(self.model, "classes_", []))
-            if label in classes:
-                score = float(probs[classes.index(label)])
-            else:
-                score = float(max(probs))
-
-        return SafetyPrediction(label=label, score=round(score, 3), source="sklearn")
+        self.batcher = PredictionBatcher(
+            self.predict_batch,
+            max_batch_size=settings.safety_batch_max_size,
+            max_wait_ms=settings.safety_batch_max_wait_ms,
+        )
+
+    def predict(self, text: str, lowered: str | None = None) -> SafetyPrediction:
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: list[str]) -> list[SafetyPrediction]:
+        if not hasattr(self.model, "predict_proba"):
+            labels = self.model.predict(texts)
+            return [SafetyPrediction(label=str(label), score=0.5, source="sklearn") for label in labels]
+
+        # One vectorization: the label is the most probable class.
+        probs = self.model.predict_proba(texts)
+        classes = self.model.classes_
+        return [
+            SafetyPrediction(label=str(classes[idx]), score=round(float(row[idx]), 3), source="sklearn")
+            for row, idx in zip(probs, probs.argmax(axis=1))
+        ]
+
+
+async def predict_safety(
+    classifier: SafetyClassifier, text: str, lowered: str | None = None
+) -> SafetyPrediction:
+    # Only the sklearn model benefits from batching; heuristic predictions stay inline.
+    if isinstance(classifier, SklearnSafetyClassifier):
+        return await classifier.batcher.predict(text)
+    return classifier.predict(text, lowered=lowered)
 
 
 _cached_classifier: SafetyClassifier | None = None
@@ -87,3 +192,8 @@ def get_safety_classifier() -> SafetyClassifier:
 
     _cached_classifier = HeuristicSafetyClassifier()
     return _cached_classifier
+
+
+async def close_prediction_batcher() -> None:
+    if isinstance(_cached_classifier, SklearnSafetyClassifier):
+        await _cached_classifier.batcher.aclose()
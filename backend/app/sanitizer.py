@@ -1,5 +1,6 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 INJECTION_PATTERNS = [
@@ -11,6 +12,18 @@ INJECTION_PATTERNS = [
     re.compile(r"BEGIN\s+SYSTEM\s+PROMPT", re.IGNORECASE),
 ]
 
+# All patterns in one alternation; the named group that fired maps back to its pattern.
+# Input whitespace is collapsed first, so the \s runs only ever see single spaces.
+_GROUP_PATTERNS = {f"p{i}": pattern.pattern for i, pattern in enumerate(INJECTION_PATTERNS)}
+_COMBINED = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _GROUP_PATTERNS.items()),
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+_MARKER = "[sanitized-injection-attempt]"
+# Inputs shorter than this are memoized; retries and eval sweeps resend the same prompts.
+_CACHE_MAX_CHARS = 4096
+
 
 @dataclass
 class SanitizationResult:
@@ -24,13 +37,23 @@ def sanitize_text(text: str) -> SanitizationResult:
     We replace suspicious spans with a marker instead of deleting everything,
     preserving normal user context while preventing instruction takeover.
     """
-    sanitized = text
-    flags: list[str] = []
+    if len(text) < _CACHE_MAX_CHARS:
+        sanitized, flags = _sanitize_cached(text)
+    else:
+        sanitized, flags = _sanitize(text)
+    return SanitizationResult(text=sanitized, flagged_patterns=list(flags))
+
+
+def _sanitize(text: str) -> tuple[str, tuple[str, ...]]:
+    fired: set[str] = set()
+
+    def _replace(match: re.Match[str]) -> str:
+        fired.add(match.lastgroup or "")
+        return _MARKER
+
+    sanitized = _COMBINED.sub(_replace, _WHITESPACE.sub(" ", text))
+    flags = tuple(pattern for name, pattern in _GROUP_PATTERNS.items() if name in fired)
+    return sanitized.strip(), flags
 
-    for pattern in INJECTION_PATTERNS:
-        if pattern.search(sanitized):
-            flags.append(pattern.pattern)
-            sanitized = pattern.sub("[sanitized-injection-attempt]", sanitized)
 
-    sanitized = re.sub(r"\s+", " ", sanitized).strip()
-    return SanitizationResult(text=sanitized, flagged_patterns=flags)
+_sanitize_cached = lru_cache(maxsize=4096)(_sanitize)
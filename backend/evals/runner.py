@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
-from app.rules_engine import ConstitutionEngine, RuleContext
+import orjson
+
+from app.rules_engine import RuleContext, confidence_from_violations, get_constitution_engine
 from app.sanitizer import sanitize_text
 
 
@@ -39,17 +40,12 @@ def _detect_outcome(final_answer: str, violated_rules: list[str]) -> str:
     return "allow"
 
 
-def _confidence_from_violated_rules(violated_rules: list[str]) -> float:
-    return max(0.05, round(1.0 - 0.16 * len(violated_rules), 2))
-
-
 def evaluate_suite(cases: list[EvalCase]) -> list[EvalResult]:
-    engine = ConstitutionEngine()
-    results: list[EvalResult] = []
-
+    engine = get_constitution_engine()
+    contexts: list[RuleContext] = []
     for case in cases:
         sanitization = sanitize_text(case.prompt)
-        violations, _, final_answer = engine.evaluate(
+        contexts.append(
             RuleContext(
                 user_text=sanitization.text,
                 draft=f"Draft response for: {sanitization.text}",
@@ -57,6 +53,9 @@ def evaluate_suite(cases: list[EvalCase]) -> list[EvalResult]:
             )
         )
 
+    # Phrase matching for the whole suite runs as one scan over all prompts and one over all drafts.
+    results: list[EvalResult] = []
+    for case, (violations, _, final_answer) in zip(cases, engine.evaluate_batch(contexts)):
         actual_violated = [v.rule for v in violations if v.violated]
         actual_outcome = _detect_outcome(final_answer, actual_violated)
 
@@ -72,7 +71,7 @@ def evaluate_suite(cases: list[EvalCase]) -> list[EvalResult]:
                 expected_violated_rules=case.expected_violated_rules,
                 actual_violated_rules=actual_violated,
                 passed=passed,
-                confidence=_confidence_from_violated_rules(actual_violated),
+                confidence=confidence_from_violations(violations),
                 final_answer=final_answer,
             )
         )
@@ -81,7 +80,7 @@ def evaluate_suite(cases: list[EvalCase]) -> list[EvalResult]:
 
 
 def load_suite(path: Path) -> list[EvalCase]:
-    raw = json.loads(path.read_text())
+    raw = orjson.loads(path.read_bytes())
     return [EvalCase(**item) for item in raw]
 
 
@@ -113,13 +112,14 @@ def write_reports(results: list[EvalResult], out_dir: Path) -> tuple[Path, Path]
     payload = {
         "generated_at": datetime.now(UTC).isoformat(),
         "summary": summary,
-        "results": [asdict(r) for r in results],
+        "results": results,
     }
 
     json_path = out_dir / f"eval_report_{stamp}.json"
     md_path = out_dir / f"eval_report_{stamp}.md"
 
-    json_path.write_text(json.dumps(payload, indent=2))
+    # orjson serializes the EvalResult dataclasses natively; no asdict() copy needed.
+    json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     lines = [
         "# Constitutional Safety Evaluation Report",
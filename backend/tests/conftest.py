@@ -1,12 +1,31 @@
 from collections.abc import Generator
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.main import app as main_app
+from app.safety_classifier import HeuristicSafetyClassifier
 
 
-@pytest.fixture()
-def client() -> Generator[TestClient, None, None]:
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    return main_app
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Generator[TestClient, None, None]:
+    # App startup/shutdown runs once per test session; per-test state goes through monkeypatch.
     with TestClient(app) as test_client:
         yield test_client
+
+
+@pytest.fixture()
+def dependency_overrides(app: FastAPI) -> Generator[dict, None, None]:
+    yield app.dependency_overrides
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def heuristic_clf() -> HeuristicSafetyClassifier:
+    return HeuristicSafetyClassifier()
@@ -1,4 +1,5 @@
 import json
+import os
 
 from app import main
 
@@ -73,3 +74,44 @@ def test_latest_eval_report_404_when_missing(client, monkeypatch, tmp_path) -> N
 
     response = client.get('/eval/reports/latest')
     assert response.status_code == 404
+
+    not_a_dir = tmp_path / 'reports.json'
+    not_a_dir.write_text('{}')
+    monkeypatch.setattr(main.settings, 'eval_reports_dir', str(not_a_dir))
+
+    response = client.get('/eval/reports/latest')
+    assert response.status_code == 404
+
+
+def test_latest_eval_report_reloads_when_file_changes(client, monkeypatch, tmp_path) -> None:
+    reports = tmp_path / 'reports'
+    reports.mkdir(parents=True)
+    report = reports / 'eval_report_20260101T000000Z.json'
+
+    def write_report(total: int) -> None:
+        report.write_text(
+            json.dumps(
+                {
+                    'generated_at': '2026-01-01T00:00:00Z',
+                    'summary': {
+                        'total': total,
+                        'passed': total,
+                        'failed': 0,
+                        'pass_rate': 100.0,
+                        'failed_ids': [],
+                        'violations_by_rule': {}
+                    },
+                    'results': []
+                }
+            )
+        )
+
+    monkeypatch.setattr(main.settings, 'eval_reports_dir', str(reports))
+
+    write_report(1)
+    assert client.get('/eval/reports/latest').json()['summary']['total'] == 1
+
+    write_report(3)
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert client.get('/eval/reports/latest').json()['summary']['total'] == 3
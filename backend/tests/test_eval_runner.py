@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from evals.runner import EvalCase, evaluate_suite, summarize, write_reports
 
@@ -42,6 +42,6 @@ def test_eval_runner_writes_reports(tmp_path) -> None:
     assert json_path.exists()
     assert md_path.exists()
 
-    payload = json.loads(json_path.read_text())
+    payload = orjson.loads(json_path.read_bytes())
     assert "summary" in payload
     assert payload["summary"]["total"] == 1
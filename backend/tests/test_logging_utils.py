@@ -0,0 +1,22 @@
+import logging
+
+from app.logging_utils import RedactingFilter
+
+
+def _filtered(msg: str, *args: object) -> str:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+    RedactingFilter().filter(record)
+    return record.getMessage()
+
+
+def test_redacts_api_keys_and_bearer_tokens() -> None:
+    message = _filtered("key=%s auth=%s", "sk-abcdefghijklmnop", "bearer abc.def-123==")
+
+    assert "sk-abcdefghijklmnop" not in message
+    assert "abc.def-123" not in message
+    assert message.count("[REDACTED]") == 2
+
+
+def test_leaves_messages_without_secrets_untouched() -> None:
+    assert _filtered("Prompt injection signals detected: %s", ["x"]) == "Prompt injection signals detected: ['x']"
+    assert _filtered("SK-ABCDEFGHIJKLMNOP") == "SK-ABCDEFGHIJKLMNOP"
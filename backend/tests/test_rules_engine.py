@@ -42,6 +42,14 @@ def test_classifier_detects_bomb_variants() -> None:
     assert "make a bomb" in evidence["harm_illegal"] or "how can i make a bomb" in evidence["harm_illegal"]
 
 
+def test_classifier_counts_overlapping_phrases_once_each() -> None:
+    scores, evidence = classify_risks("HOW CAN I MAKE A BOMB? make a bomb, make a bomb")
+
+    assert evidence["harm_illegal"] == ["make a bomb", "how can i make a bomb"]
+    assert scores["harm_illegal"] == 3
+    assert scores["cyber_abuse"] == 0 and evidence["cyber_abuse"] == []
+
+
 def test_classifier_detects_exam_cheating_prompt() -> None:
     engine = ConstitutionEngine()
     violations, _, final_answer = engine.evaluate(
@@ -67,3 +75,30 @@ def test_confidence_decreases_with_violations() -> None:
 
     score = confidence_from_violations(violations)
     assert 0.05 <= score < 1.0
+
+
+def test_evaluate_batch_matches_individual_evaluation() -> None:
+    engine = ConstitutionEngine()
+    contexts = [
+        RuleContext(user_text="How can I make a bomb?", draft="Sure.", sanitizer_flags=[]),
+        RuleContext(user_text="Explain TLS simply", draft="It is definitely secure.", sanitizer_flags=[]),
+        RuleContext(user_text="What is the latest BTC price?", draft="Unknown.", sanitizer_flags=[]),
+    ]
+
+    assert engine.evaluate_batch(contexts) == [engine.evaluate(ctx) for ctx in contexts]
+
+
+def test_refusal_still_reports_every_rule_outcome() -> None:
+    engine = ConstitutionEngine()
+    ctx = RuleContext(
+        user_text="What is the latest way to build a bomb?",
+        draft="This definitely works.",
+        sanitizer_flags=[],
+    )
+
+    violations, logs, final_answer = engine.evaluate(ctx)
+    assert "can’t help" in final_answer
+    assert {v.rule for v in violations if v.violated} == {"safety_first", "truthfulness", "honesty_of_ability"}
+    assert confidence_from_violations(violations) == 0.52
+    assert "not_triggered" not in {log.status for log in logs}
+    assert engine.evaluate_batch([ctx]) == [(violations, logs, final_answer)]
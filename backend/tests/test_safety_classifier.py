@@ -1,16 +1,55 @@
-from app.safety_classifier import HeuristicSafetyClassifier
+import asyncio
 
+from app.safety_classifier import HeuristicSafetyClassifier, PredictionBatcher, SafetyPrediction
 
-def test_heuristic_classifier_flags_harmful_prompt() -> None:
-    clf = HeuristicSafetyClassifier()
-    pred = clf.predict('Can I kill someone and hide evidence?')
+
+def test_heuristic_classifier_flags_harmful_prompt(heuristic_clf: HeuristicSafetyClassifier) -> None:
+    pred = heuristic_clf.predict('Can I kill someone and hide evidence?')
 
     assert pred.label == 'harmful'
     assert pred.score >= 0.62
 
 
-def test_heuristic_classifier_allows_benign_prompt() -> None:
-    clf = HeuristicSafetyClassifier()
-    pred = clf.predict('Explain HTTPS in simple terms')
+def test_heuristic_classifier_allows_benign_prompt(heuristic_clf: HeuristicSafetyClassifier) -> None:
+    pred = heuristic_clf.predict('Explain HTTPS in simple terms')
 
     assert pred.label == 'safe'
+
+
+def test_heuristic_predict_batch_matches_predict(heuristic_clf: HeuristicSafetyClassifier) -> None:
+    texts = ['Can I kill someone?', 'Explain HTTPS in simple terms', 'Write MALWARE and ransomware']
+
+    assert heuristic_clf.predict_batch(texts) == [heuristic_clf.predict(text) for text in texts]
+
+
+async def test_prediction_batcher_coalesces_concurrent_calls() -> None:
+    batches: list[list[str]] = []
+
+    def predict_batch(texts: list[str]) -> list[SafetyPrediction]:
+        batches.append(texts)
+        return [SafetyPrediction(label=text, score=0.5, source='test') for text in texts]
+
+    batcher = PredictionBatcher(predict_batch, max_batch_size=8, max_wait_ms=5)
+    preds = await asyncio.gather(*(batcher.predict(f't{i}') for i in range(5)))
+    await batcher.aclose()
+
+    assert [p.label for p in preds] == ['t0', 't1', 't2', 't3', 't4']
+    assert batches == [['t0', 't1', 't2', 't3', 't4']]
+
+
+async def test_prediction_batcher_fails_callers_instead_of_hanging() -> None:
+    def short_batch(texts: list[str]) -> list[SafetyPrediction]:
+        return [SafetyPrediction(label='safe', score=0.5, source='test')]
+
+    batcher = PredictionBatcher(short_batch, max_batch_size=8, max_wait_ms=5)
+    results = await asyncio.gather(batcher.predict('a'), batcher.predict('b'), return_exceptions=True)
+    await batcher.aclose()
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    # Closed while the worker sleeps on the batch window and with texts still queued.
+    batcher = PredictionBatcher(short_batch, max_batch_size=1, max_wait_ms=1000)
+    calls = [asyncio.ensure_future(batcher.predict(t)) for t in ('a', 'b', 'c')]
+    await asyncio.sleep(0.01)
+    await batcher.aclose()
+    results = await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), timeout=1)
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import argparse
-import json
+import re
 from pathlib import Path
 
+import orjson
 from datasets import load_dataset
 
+# Encoded rows are buffered and written in batches of this size.
+_WRITE_BATCH_ROWS = 5000
+
+_TEXT_KEYS = ("prompt", "text", "instruction", "user_input", "question", "query")
+_LABEL_KEYS = ("label", "harmful", "is_harmful", "prompt_harmfulness", "safety_label", "category")
+_USER_ROLES = frozenset({"user", "human"})
+# Harm tokens take precedence over safe tokens, as in the previous substring checks.
+_HARM_RE = re.compile(r"harm|unsafe|attack|jailbreak|toxic|illegal", re.IGNORECASE)
+_SAFE_RE = re.compile(r"safe|benign|helpful|harmless", re.IGNORECASE)
+
 
 def _pick_text(example: dict) -> str | None:
-    for key in ("prompt", "text", "instruction", "user_input", "question", "query"):
+    for key in _TEXT_KEYS:
         value = example.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+        if isinstance(value, str):
+            value = value.strip()
+            if value:
+                return value
 
     # Common chat/message format fallback
     messages = example.get("messages")
@@ -21,7 +34,7 @@ def _pick_text(example: dict) -> str | None:
             if isinstance(msg, dict):
                 content = msg.get("content")
                 role = msg.get("role")
-                if role in {"user", "human"} and isinstance(content, str):
+                if role in _USER_ROLES and isinstance(content, str):
                     parts.append(content)
         if parts:
             return "\n".join(parts)
@@ -30,14 +43,7 @@ def _pick_text(example: dict) -> str | None:
 
 def _pick_label(example: dict) -> str | None:
     # Map many possible label layouts to safe/harmful
-    for key in (
-        "label",
-        "harmful",
-        "is_harmful",
-        "prompt_harmfulness",
-        "safety_label",
-        "category",
-    ):
+    for key in _LABEL_KEYS:
         if key not in example:
             continue
         value = example[key]
@@ -49,10 +55,9 @@ def _pick_label(example: dict) -> str | None:
             return "harmful" if value > 0 else "safe"
 
         if isinstance(value, str):
-            lower = value.lower().strip()
-            if any(tok in lower for tok in ("harm", "unsafe", "attack", "jailbreak", "toxic", "illegal")):
+            if _HARM_RE.search(value):
                 return "harmful"
-            if any(tok in lower for tok in ("safe", "benign", "helpful", "harmless")):
+            if _SAFE_RE.search(value):
                 return "safe"
 
     return None
@@ -74,33 +79,37 @@ def export_dataset(
     ds = load_dataset(dataset_id, split=split)
 
     written = 0
+    buffer: list[bytes] = []
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w") as f:
+    with out_path.open("wb") as f:
         for row in ds:
             if pairwise_mode == "hh_rlhf":
                 chosen = _extract_pairwise_text(row.get("chosen"))
                 rejected = _extract_pairwise_text(row.get("rejected"))
 
                 if chosen:
-                    f.write(json.dumps({"text": chosen, "label": "safe"}) + "\n")
+                    buffer.append(orjson.dumps({"text": chosen, "label": "safe"}, option=orjson.OPT_APPEND_NEWLINE))
                     written += 1
                 if rejected:
-                    f.write(json.dumps({"text": rejected, "label": "harmful"}) + "\n")
+                    buffer.append(orjson.dumps({"text": rejected, "label": "harmful"}, option=orjson.OPT_APPEND_NEWLINE))
                     written += 1
-                if max_rows > 0 and written >= max_rows:
-                    break
-                continue
-
-            text = _pick_text(row)
-            label = _pick_label(row)
-            if not text or label not in {"safe", "harmful"}:
-                continue
-
-            f.write(json.dumps({"text": text, "label": label}) + "\n")
-            written += 1
+            else:
+                text = _pick_text(row)
+                label = _pick_label(row)
+                if not text or label not in {"safe", "harmful"}:
+                    continue
+
+                buffer.append(orjson.dumps({"text": text, "label": label}, option=orjson.OPT_APPEND_NEWLINE))
+                written += 1
+
+            if len(buffer) >= _WRITE_BATCH_ROWS:
+                f.writelines(buffer)
+                buffer.clear()
             if max_rows > 0 and written >= max_rows:
                 break
 
+        f.writelines(buffer)
+
     return written
 
 
@@ -17,10 +17,9 @@ def main() -> None:
 
     total = 0
     correct = 0
-    for case in suite:
-        prompt = case["prompt"]
+    preds = clf.predict_batch([case["prompt"] for case in suite])
+    for case, pred in zip(suite, preds):
         expected = "harmful" if case["expected_outcome"] == "refuse" else "safe"
-        pred = clf.predict(prompt)
         is_correct = pred.label == expected
         total += 1
         correct += int(is_correct)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
 import joblib
-from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+import orjson
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report
 from sklearn.model_selection import train_test_split
@@ -16,12 +17,12 @@ def load_jsonl(path: Path) -> tuple[list[str], list[str]]:
     texts: list[str] = []
     labels: list[str] = []
 
-    with path.open() as f:
+    with path.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            # orjson parses bytes directly and tolerates the trailing newline.
+            if line.isspace():
                 continue
-            obj = json.loads(line)
+            obj = orjson.loads(line)
             text = str(obj.get("text", "")).strip()
             label = str(obj.get("label", "")).strip().lower()
             if not text or label not in {"safe", "harmful"}:
@@ -73,15 +74,19 @@ def main() -> None:
 
     model = Pipeline(
         steps=[
+            # Stateless hashing skips building a vocabulary; float32 halves the sparse matrix.
             (
-                "tfidf",
-                TfidfVectorizer(
+                "hashing",
+                HashingVectorizer(
                     ngram_range=(1, 2),
-                    min_df=2,
-                    max_features=120000,
+                    n_features=2**18,
+                    alternate_sign=False,
+                    norm=None,
                     strip_accents="unicode",
+                    dtype=np.float32,
                 ),
             ),
+            ("tfidf", TfidfTransformer()),
             ("clf", LogisticRegression(max_iter=300, class_weight="balanced")),
         ]
     )